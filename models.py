@@ -1,20 +1,32 @@
 """Pydantic models."""
 
+import re
+from functools import cached_property
 from typing import Annotated
 
-from pydantic import BaseModel, Field, HttpUrl, StrictStr, StrictFloat
+from pydantic import BaseModel, Field, computed_field
+
+# Stock name with the ticker in parentheses, e.g. 'Apple Inc. (AAPL)'.
+_SYMBOL_RE = r"^.+ \(([A-Z]{1,5})\)$"
+_SYMBOL_PATTERN = re.compile(_SYMBOL_RE)
+
+# HTTP(S) URL, e.g. 'https://www.reddit.com/r/stocks/'.
+_URL_RE = r"^https?://"
 
 
 class Link(BaseModel):
     """Link to where a stock was mentioned."""
 
     url: Annotated[
-        HttpUrl,
-        Field(description="Direct link to the post where the stock was mentioned."),
+        str,
+        Field(
+            pattern=_URL_RE,
+            description="Direct link to the post where the stock was mentioned.",
+        ),
     ]
 
     title: Annotated[
-        StrictStr,
+        str,
         Field(
             min_length=1,
             max_length=200,
@@ -27,9 +39,9 @@ class PlotDataPoint(BaseModel):
     """Raw data to plot in the final plot."""
 
     symbol: Annotated[
-        StrictStr,
+        str,
         Field(
-            pattern=r"^.+ \(([A-Z]{1,5})\)$",
+            pattern=_SYMBOL_RE,
             description="Stock name with ticker in parentheses, e.g. 'Apple Inc. (AAPL)'."
             "It is critical that the ticker is in uppercase and has at least 1 and at most 5 characters.",
             examples=["Apple Inc. (AAPL)", "Tesla Inc. (TSLA)"],
@@ -37,7 +49,7 @@ class PlotDataPoint(BaseModel):
     ]
 
     sentiment: Annotated[
-        StrictFloat,
+        float,
         Field(
             ge=-1.0,
             le=1.0,
@@ -48,7 +60,7 @@ class PlotDataPoint(BaseModel):
     ]
 
     presence: Annotated[
-        StrictFloat,
+        float,
         Field(
             ge=0.0,
             le=1.0,
@@ -57,7 +69,7 @@ class PlotDataPoint(BaseModel):
     ]
 
     summary: Annotated[
-        StrictStr,
+        str,
         Field(
             max_length=2000,
             description="A short summary of the stock analysis and reasoning for sentiment/presence values.",
@@ -73,62 +85,27 @@ class PlotDataPoint(BaseModel):
         ),
     ]
 
-
-# --- Data to plot in the final plot ---
-
-
-class PlotDatasetPointData(BaseModel):
-    """Coordinates for a dataset point in the plot."""
-
-    x: Annotated[StrictFloat, Field(description="X-axis value (sentiment).")]
-    y: Annotated[StrictFloat, Field(description="Y-axis value (presence).")]
-
-
-class PlotDatasetPoint(BaseModel):
-    """Dataset point to plot in the final plot."""
-
-    label: Annotated[
-        StrictStr, Field(description="Label for the dataset point in the plot.")
-    ]
-
-    data: Annotated[
-        list[PlotDatasetPointData],
-        Field(
-            min_length=1,
-            description="List of PlotDatasetPointData containing coordinates for the dataset point.",
-        ),
-    ]
-
-    backgroundColor: Annotated[
-        StrictStr,
-        Field(
-            description="Background color for the dataset point in the plot.",
-            pattern=r"^#[0-9a-fA-F]{6}$",
-            examples=["#FF5733", "#33FF57"],
-        ),
-    ]
-
-    borderColor: Annotated[
-        StrictStr,
-        Field(
-            description="Border color for the dataset point in the plot.",
-            pattern=r"^#[0-9a-fA-F]{6}$",
-            examples=["#FF5733", "#33FF57"],
-        ),
-    ]
-
-    pointRadius: Annotated[
-        StrictFloat,
-        Field(
-            description="Radius of the point in the plot. 0.0 means no point.",
-            examples=[5.0, 10.0],
-        ),
-    ]
-
-    pointHoverRadius: Annotated[
-        StrictFloat,
-        Field(
-            description="Radius of the point when hovered in the plot.",
-            examples=[7.0, 15.0],
-        ),
-    ]
+    @computed_field
+    @cached_property
+    def ticker(self) -> str:
+        """Ticker extracted from the symbol, e.g. 'AAPL' for 'Apple Inc. (AAPL)'."""
+        return _SYMBOL_PATTERN.search(self.symbol).group(1)
+
+    @classmethod
+    def from_trusted(cls, data: dict) -> "PlotDataPoint":
+        """Build a PlotDataPoint from already validated data without revalidating.
+
+        Only use this for data that has passed validation before, e.g. after it
+        was checked at the MCP boundary.
+
+        Args:
+            data: Dictionary with the PlotDataPoint fields.
+
+        Returns:
+            PlotDataPoint: The constructed instance.
+        """
+        links = [
+            link if isinstance(link, Link) else Link.model_construct(**link)
+            for link in data.get("links", [])
+        ]
+        return cls.model_construct(**{**data, "links": links})
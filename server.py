@@ -1,20 +1,76 @@
 """Main server file for the r/Stocks Sentiment Reddit MCP."""
 
+import asyncio
 import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
 
+import orjson
 from fastmcp import FastMCP
-from services.reddit_service import RedditService
+from services.reddit_service import CommentRow, RedditService
 from services.visualization_service import VisualizationService
 
 from models import PlotDataPoint
 
+# Run the event loop on uvloop where it is available (it does not support Windows)
+try:
+    import uvloop
+except ImportError:
+    pass
+else:
+    uvloop.install()
+
+
+# ---- Shared Reddit Service ----
+
+
+_reddit_service: RedditService | None = None
+_reddit_service_lock = asyncio.Lock()
+
+
+async def _get_reddit_service() -> RedditService:
+    """Return the shared RedditService, creating it on first use.
+
+    A service whose Reddit client could not be created is rebuilt on the next
+    call, so fixing the credentials does not require a server restart.
+
+    Returns:
+        RedditService: The service instance shared by all tool calls.
+    """
+    global _reddit_service
+    async with _reddit_service_lock:
+        if _reddit_service is None or _reddit_service.client is None:
+            _reddit_service = await RedditService.create()
+        return _reddit_service
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the shared RedditService when the server shuts down."""
+    global _reddit_service
+    try:
+        yield
+    finally:
+        if _reddit_service is not None:
+            await _reddit_service.close()
+            _reddit_service = None
+
+
+def _serialize_tool_result(data: Any) -> str:
+    """Serialize a tool result to JSON text with orjson."""
+    return orjson.dumps(data, default=str).decode()
+
 
 # Create the server
 mcp = FastMCP(
     name="r/Stocks Sentiment Reddit",
+    lifespan=_lifespan,
+    tool_serializer=_serialize_tool_result,
     dependencies=[
         "asyncpraw>=7.8.1",
         "fastmcp>=2.11.1",
+        "orjson>=3.10.0",
+        "uvloop>=0.19.0; sys_platform != 'win32'",
         "textblob>=0.17.1",
         "matplotlib>=3.7.0",
         "pandas>=2.0.0",
@@ -40,25 +96,12 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-# ---- MCP Tools ----
-
-
-@mcp.prompt
-async def make_r_stocks_plot() -> str:
-    """Get a prompt to create a plot with the r/Stocks data."""
-    return """Please create a sentiment plot for the r/Stocks subreddit posts. Start by creating a plan by calling 'make_stocks_plot_plan' before you create the plot."""
+# ---- Prompt Texts ----
 
 
-@mcp.tool
-async def make_stocks_plot_plan() -> str:
-    """Returns a plan for creating a plot with the r/Stocks data.
-
-    Before you call the create_plot tool, always call this tool to get an exact plan.
+_PROMPT_TEXT = """Please create a sentiment plot for the r/Stocks subreddit posts. Start by creating a plan by calling 'make_stocks_plot_plan' before you create the plot."""
 
-    Returns:
-        str: A detailed plan for creating the plot with the r/Stocks data.
-    """
-    return """Here is the exact plan you need to follow to create the plot:
+_PLAN_TEXT = """Here is the exact plan you need to follow to create the plot:
 
 Step 1: Fetch posts
 Fetch the latest posts from the r/Stocks subreddit using the fetch_stocks_subreddit_posts tool.
@@ -115,6 +158,27 @@ where each dictionary contains the following keys:
 """
 
 
+# ---- MCP Tools ----
+
+
+@mcp.prompt
+async def make_r_stocks_plot() -> str:
+    """Get a prompt to create a plot with the r/Stocks data."""
+    return _PROMPT_TEXT
+
+
+@mcp.tool
+async def make_stocks_plot_plan() -> str:
+    """Returns a plan for creating a plot with the r/Stocks data.
+
+    Before you call the create_plot tool, always call this tool to get an exact plan.
+
+    Returns:
+        str: A detailed plan for creating the plot with the r/Stocks data.
+    """
+    return _PLAN_TEXT
+
+
 @mcp.tool
 async def fetch_stocks_subreddit_posts() -> dict:
     """Fetches the latest posts from the r/Stocks subreddit.
@@ -122,7 +186,7 @@ async def fetch_stocks_subreddit_posts() -> dict:
     Returns:
         dict: A dictionary containing a list of posts with titles and content.
     """
-    reddit_service = await RedditService.create()
+    reddit_service = await _get_reddit_service()
     return await reddit_service.fetch_subreddit_posts()
 
 
@@ -137,8 +201,15 @@ async def fetch_single_reddit_post(post_id: str) -> dict:
         dict: A dictionary containing the post data with additional metadata like score,
               upvote ratio, number of comments, and subreddit name.
     """
-    reddit_service = await RedditService.create()
-    return await reddit_service.fetch_single_post(post_id=post_id)
+    reddit_service = await _get_reddit_service()
+    result = await reddit_service.fetch_single_post(post_id=post_id)
+    if "post" in result:
+        post = result["post"]
+        post["comments"] = [
+            {name: getattr(comment, name) for name in CommentRow.__slots__}
+            for comment in post["comments"]
+        ]
+    return result
 
 
 @mcp.tool
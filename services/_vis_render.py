@@ -0,0 +1,129 @@
+"""Pure HTML rendering functions for the stock information boxes."""
+
+from functools import lru_cache
+from html import escape
+from itertools import starmap
+from string import Template
+
+from models import PlotDataPoint
+
+# Symbol, sentiment, presence, summary and (url, title) links of a stock box
+BoxKey = tuple[str, float, float, str, tuple[tuple[str, str], ...]]
+
+# Sentiment colors for negative, neutral and positive, indexed by sign + 1
+_SENTIMENT_COLORS = ("#dc3545", "#6c757d", "#28a745")
+
+# HTML of a single stock box
+_BOX_TEMPLATE = Template("""
+            <div class="stock-box">
+                <div class="stock-header">$symbol</div>
+                <div class="stock-metrics">
+                    <div class="metric">
+                        <div class="metric-label">Sentiment</div>
+                        <div class="metric-value" style="color: $sentiment_color">$sentiment</div>
+                    </div>
+                    <div class="metric">
+                        <div class="metric-label">Presence</div>
+                        <div class="metric-value">$presence</div>
+                    </div>
+                </div>
+                <div class="summary">
+                    <h4>Analysis Summary</h4>
+                    <p>$summary</p>
+                </div>
+                <div class="links">
+                    <h4>Related Posts</h4>
+                    $links_html
+                </div>
+            </div>
+            """)
+
+# Boxes with more links than this are not cached to keep cache entries small
+_MAX_CACHED_LINKS = 16
+
+
+def render_li(url: str, title: str) -> str:
+    """Render a link as an HTML list item.
+
+    Args:
+        url: The link target.
+        title: The link text.
+
+    Returns:
+        HTML string for the list item.
+    """
+    url = escape(url)
+    title = escape(title, quote=False)
+    return f'<li><a href="{url}" target="_blank">{title}</a></li>'
+
+
+def _render_box(key: BoxKey) -> str:
+    """Render the HTML information box for a single stock.
+
+    Args:
+        key: The symbol, sentiment, presence, summary and (url, title) links.
+
+    Returns:
+        HTML string for the stock box.
+    """
+    symbol, sentiment, presence, summary, links = key
+
+    # Format sentiment with color
+    sentiment_color = _SENTIMENT_COLORS[(sentiment > 0) - (sentiment < 0) + 1]
+    sentiment_text = format(sentiment, ".2f")
+    presence_text = format(presence, ".2f")
+
+    # Escape the LLM-provided text so it cannot break the page markup
+    symbol = escape(symbol, quote=False)
+    summary = escape(summary, quote=False)
+
+    # Generate links HTML
+    if links:
+        links_html = f"<ul>{''.join(starmap(render_li, links))}</ul>"
+    else:
+        links_html = "<p>No links available</p>"
+
+    return _BOX_TEMPLATE.substitute(
+        symbol=symbol,
+        sentiment_color=sentiment_color,
+        sentiment=sentiment_text,
+        presence=presence_text,
+        summary=summary,
+        links_html=links_html,
+    )
+
+
+_render_box_cached = lru_cache(maxsize=256)(_render_box)
+
+
+def render_box(item: PlotDataPoint) -> str:
+    """Render the HTML information box for a single stock, reusing earlier renders.
+
+    Args:
+        item: The stock data to render.
+
+    Returns:
+        HTML string for the stock box.
+    """
+    key = (
+        item.symbol,
+        item.sentiment,
+        item.presence,
+        item.summary,
+        tuple((link.url, link.title) for link in item.links),
+    )
+    if len(key[4]) > _MAX_CACHED_LINKS:
+        return _render_box(key)
+    return _render_box_cached(key)
+
+
+def render_boxes(stock_data: list[PlotDataPoint]) -> list[bytes]:
+    """Render the HTML information boxes for all stocks.
+
+    Args:
+        stock_data: List of stock data to render.
+
+    Returns:
+        UTF-8 encoded HTML for each stock box.
+    """
+    return [render_box(item).encode("utf-8") for item in stock_data]
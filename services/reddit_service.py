@@ -2,21 +2,89 @@
 
 import logging
 import os
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, Generator, Optional
+from itertools import islice
+from typing import Any, Dict, Generator, Iterable, Optional
 
+import aiohttp
 import asyncpraw
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _new_session() -> aiohttp.ClientSession:
+    """Create the HTTP session for a Reddit client.
+
+    The session keeps a pool of connections alive between requests and is
+    closed together with the client that uses it. Must be called from within
+    the running event loop.
+
+    Returns:
+        aiohttp.ClientSession: A new session with a pooling connector.
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=32, ttl_dns_cache=300, keepalive_timeout=60
+        ),
+        timeout=aiohttp.ClientTimeout(total=None),
+    )
+
+
+def _iter_comments(forest: Iterable[Any]) -> Generator[Any, None, None]:
+    """Depth-first iterator over a comment forest.
+
+    Args:
+        forest: Top-level comments, each with a ``replies`` forest.
+
+    Yields:
+        Comments in depth-first order.
+    """
+    stack = deque(forest)
+    while stack:
+        comment = stack.popleft()
+        yield comment
+        if comment.replies:
+            stack.extendleft(reversed(list(comment.replies)))
+
+
+@dataclass(slots=True)
+class CommentRow:
+    """A single comment of a Reddit post."""
+
+    id: str
+    author: str
+    body: str
+    score: int
+    created_utc: float
+    parent_id: str
+
+
+def _comment_row(comment: Any) -> CommentRow:
+    """Convert a Reddit comment into a CommentRow.
+
+    Args:
+        comment: The asyncpraw comment.
+
+    Returns:
+        CommentRow: The comment data.
+    """
+    author = comment.author
+    return CommentRow(
+        id=comment.id,
+        author=author.name if author is not None else "Unknown",
+        body=comment.body,
+        score=comment.score,
+        created_utc=comment.created_utc,
+        parent_id=comment.parent_id,
+    )
+
+
+@dataclass(slots=True)
 class RedditService:
     """Service for interacting with Reddit API."""
 
-    client_id: Optional[str] = field(default=None, init=False)
-    client_secret: Optional[str] = field(default=None, init=False)
     client: Optional[asyncpraw.Reddit] = field(default=None, init=False)
 
     @classmethod
@@ -24,31 +92,31 @@ class RedditService:
         """Create a new RedditService instance with credentials from environment.
 
         Returns:
-            RedditService: A new instance of the service with credentials populated.
+            RedditService: A new instance of the service with its client populated.
         """
         instance = cls()
 
         client_id = os.environ.get("REDDIT_CLIENT_ID")
         client_secret = os.environ.get("REDDIT_CLIENT_SECRET")
 
-        instance.client_id = client_id
-        instance.client_secret = client_secret
-
         if not client_id or not client_secret:
             logger.error("Reddit API credentials not found in environment variables")
             instance.client = None
             return instance
 
+        session = _new_session()
         try:
             client = asyncpraw.Reddit(
                 client_id=client_id,
                 client_secret=client_secret,
                 user_agent="StocksAnalyzer/0.1 MCP",
+                requestor_kwargs={"session": session},
             )
             instance.client = client
             return instance
         except Exception as e:
-            logger.error(f"Error creating Reddit client: {str(e)}")
+            logger.error("Error creating Reddit client: %s", e)
+            await session.close()
             instance.client = None
             return instance
 
@@ -71,23 +139,24 @@ class RedditService:
             subreddit = await self.client.subreddit(subreddit_name)
             hot_posts = subreddit.hot(limit=limit)
 
-            posts = []
-            async for post in hot_posts:
-                post_data = {
+            # Listing items already carry their data, so no per-post fetch is needed
+            submissions = [post async for post in hot_posts]
+
+            posts = [
+                {
                     "title": post.title,
                     "content": post.selftext,
                     "url": post.url,
                     "author": str(post.author) if post.author else "Unknown",
                     "created_utc": post.created_utc,
                 }
-                posts.append(post_data)
-                logger.info(
-                    f"Fetched post: {post_data['title']} by {post_data['author']}"
-                )
+                for post in submissions
+            ]
+            logger.info("Fetched %d posts from r/%s", len(posts), subreddit_name)
 
             return {"posts": posts}
         except Exception as e:
-            logger.error(f"Error fetching posts from r/{subreddit_name}: {str(e)}")
+            logger.error("Error fetching posts from r/%s: %s", subreddit_name, e)
             return {"error": f"Failed to fetch posts: {str(e)}"}
 
     async def fetch_single_post(
@@ -108,11 +177,10 @@ class RedditService:
         try:
             # Accept raw ID or full URL
             if post_id.startswith("http"):
-                parts = post_id.split("/")
-                if "comments" in parts:
-                    post_id = parts[parts.index("comments") + 1]
-                else:
+                _, sep, rest = post_id.partition("/comments/")
+                if not sep:
                     return {"error": "Invalid Reddit URL format"}
+                post_id = rest.split("/", 1)[0]
 
             # Fetch submission
             submission = await self.client.submission(id=post_id)
@@ -123,25 +191,11 @@ class RedditService:
             submission.comment_limit = comment_limit
             await submission.comments.replace_more(limit=0)
 
-            def _flatten_comments(forest: list) -> Generator[Any, None, None]:
-                """Depth-first iterator over a comment forest."""
-                for comment in forest:
-                    yield comment
-                    if comment.replies:
-                        yield from _flatten_comments(comment.replies)
-
-            raw_comments = list(_flatten_comments(submission.comments))[:comment_limit]
-
             comments = [
-                {
-                    "id": comment.id,
-                    "author": str(comment.author) if comment.author else "Unknown",
-                    "body": comment.body,
-                    "score": comment.score,
-                    "created_utc": comment.created_utc,
-                    "parent_id": comment.parent_id,
-                }
-                for comment in raw_comments
+                _comment_row(comment)
+                for comment in islice(
+                    _iter_comments(submission.comments), comment_limit
+                )
             ]
 
             # Assemble response
@@ -159,12 +213,12 @@ class RedditService:
             }
 
             logger.info(
-                f"Fetched post '{post_data['title']}' with {len(comments)} comments"
+                "Fetched post '%s' with %d comments", post_data["title"], len(comments)
             )
             return {"post": post_data}
 
         except Exception as e:
-            logger.error(f"Error fetching post {post_id}: {e}")
+            logger.error("Error fetching post %s: %s", post_id, e)
             return {"error": f"Failed to fetch post: {e}"}
 
     async def close(self) -> None:
@@ -1,144 +1,27 @@
 """Visualization service for creating stock sentiment plots."""
 
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
 import json
 import logging
 import os
+from pathlib import Path
+import sys
 import tempfile
+import threading
 import webbrowser
 
-from models import PlotDataPoint, PlotDatasetPoint
+import orjson
 
-logger = logging.getLogger(__name__)
-
-
-@dataclass
-class VisualizationService:
-    """Service for creating interactive stock sentiment visualizations."""
-
-    colors: list[str] = field(
-        default_factory=lambda: [
-            "#FF6384",
-            "#36A2EB",
-            "#FFCE56",
-            "#4BC0C0",
-            "#9966FF",
-            "#FF9F40",
-            "#FF6384",
-            "#C9CBCF",
-            "#4BC0C0",
-            "#FF6384",
-        ]
-    )
-
-    @classmethod
-    async def create(cls) -> "VisualizationService":
-        """Create a new VisualizationService instance."""
-        return cls()
-
-    async def _generate_datasets(
-        self, *, data: list[PlotDataPoint]
-    ) -> list[PlotDatasetPoint]:
-        """Generate Chart.js datasets from stock data.
-
-        Args:
-            data: List of stock data dictionaries.
+from models import PlotDataPoint
+from services._vis_render import render_boxes
 
-        Returns:
-            List of Chart.js dataset dictionaries.
-        """
-        datasets: list[PlotDatasetPoint] = []
-        for i, item in enumerate(data):
-            # Calculate point size based on presence (radius between 5-20)
-            point_radius = max(5, min(20, item.presence * 20))
-
-            datasets.append(
-                PlotDatasetPoint(
-                    label=item.symbol,
-                    data=[{"x": item.sentiment, "y": item.presence}],
-                    backgroundColor=self.colors[i % len(self.colors)],
-                    borderColor=self.colors[i % len(self.colors)],
-                    pointRadius=point_radius,
-                    pointHoverRadius=point_radius + 3,
-                )
-            )
-        return datasets
-
-    async def _generate_stock_boxes_html(
-        self, *, stock_data: list[PlotDataPoint]
-    ) -> str:
-        """Generate HTML for stock information boxes.
-
-        Args:
-            stock_data: List of stock data dictionaries.
-
-        Returns:
-            HTML string for stock boxes.
-        """
-        boxes_html = ""
-        for item in stock_data:
-            # Format sentiment with color
-            sentiment_color = (
-                "#28a745"
-                if item.sentiment > 0
-                else "#dc3545"
-                if item.sentiment < 0
-                else "#6c757d"
-            )
-
-            # Generate links HTML
-            links_html = ""
-            if item.links:
-                links_html = "<ul>"
-                for link in item.links:
-                    url = link.url
-                    title = link.title
-                    links_html += (
-                        f'<li><a href="{url}" target="_blank">{title}</a></li>'
-                    )
-
-                links_html += "</ul>"
-            else:
-                links_html = "<p>No links available</p>"
-
-            boxes_html += f"""
-            <div class="stock-box">
-                <div class="stock-header">{item.symbol}</div>
-                <div class="stock-metrics">
-                    <div class="metric">
-                        <div class="metric-label">Sentiment</div>
-                        <div class="metric-value" style="color: {sentiment_color}">{item.sentiment:.2f}</div>
-                    </div>
-                    <div class="metric">
-                        <div class="metric-label">Presence</div>
-                        <div class="metric-value">{item.presence:.2f}</div>
-                    </div>
-                </div>
-                <div class="summary">
-                    <h4>Analysis Summary</h4>
-                    <p>{item.summary}</p>
-                </div>
-                <div class="links">
-                    <h4>Related Posts</h4>
-                    {links_html}
-                </div>
-            </div>
-            """
-        return boxes_html
-
-    async def _get_html_template(
-        self, *, datasets: list[PlotDatasetPoint], stock_boxes_html: str
-    ) -> str:
-        """Generate the complete HTML template for the visualization.
+logger = logging.getLogger(__name__)
 
-        Args:
-            datasets: Chart.js datasets.
-            stock_boxes_html: HTML for stock information boxes.
 
-        Returns:
-            Complete HTML string.
-        """
-        return f"""<!DOCTYPE html>
+# Static parts of the HTML page, split around the stock boxes and the datasets
+_HTML_PREFIX = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -146,114 +29,114 @@ class VisualizationService:
     <title>r/Stocks Sentiment Analysis</title>
     <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
     <style>
-        body {{
+        body {
             font-family: Arial, sans-serif;
             margin: 20px;
             background-color: #f5f5f5;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background-color: white;
             padding: 20px;
             border-radius: 8px;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        h1 {{
+        }
+        h1 {
             text-align: center;
             color: #333;
             margin-bottom: 30px;
-        }}
-        .chart-container {{
+        }
+        .chart-container {
             position: relative;
             height: 600px;
             margin: 20px 0;
-        }}
-        .info {{
+        }
+        .info {
             background-color: #e3f2fd;
             padding: 15px;
             border-radius: 5px;
             margin-bottom: 20px;
-        }}
-        .info h3 {{
+        }
+        .info h3 {
             margin-top: 0;
             color: #1976d2;
-        }}
-        .data-section {{
+        }
+        .data-section {
             margin-top: 40px;
-        }}
-        .stock-box {{
+        }
+        .stock-box {
             background-color: #f8f9fa;
             border: 1px solid #dee2e6;
             border-radius: 8px;
             padding: 20px;
             margin-bottom: 20px;
             box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }}
-        .stock-header {{
+        }
+        .stock-header {
             font-size: 1.4em;
             font-weight: bold;
             color: #333;
             margin-bottom: 15px;
             border-bottom: 2px solid #007bff;
             padding-bottom: 8px;
-        }}
-        .stock-metrics {{
+        }
+        .stock-metrics {
             display: flex;
             gap: 30px;
             margin-bottom: 15px;
-        }}
-        .metric {{
+        }
+        .metric {
             background-color: white;
             padding: 10px 15px;
             border-radius: 5px;
             border: 1px solid #e0e0e0;
-        }}
-        .metric-label {{
+        }
+        .metric-label {
             font-weight: bold;
             color: #666;
             font-size: 0.9em;
-        }}
-        .metric-value {{
+        }
+        .metric-value {
             font-size: 1.2em;
             color: #333;
             margin-top: 5px;
-        }}
-        .summary {{
+        }
+        .summary {
             background-color: white;
             padding: 15px;
             border-radius: 5px;
             border: 1px solid #e0e0e0;
             margin-bottom: 15px;
-        }}
-        .summary h4 {{
+        }
+        .summary h4 {
             margin-top: 0;
             color: #333;
-        }}
-        .links {{
+        }
+        .links {
             background-color: white;
             padding: 15px;
             border-radius: 5px;
             border: 1px solid #e0e0e0;
-        }}
-        .links h4 {{
+        }
+        .links h4 {
             margin-top: 0;
             color: #333;
-        }}
-        .links ul {{
+        }
+        .links ul {
             margin: 10px 0;
             padding-left: 20px;
-        }}
-        .links li {{
+        }
+        .links li {
             margin-bottom: 8px;
-        }}
-        .links a {{
+        }
+        .links a {
             color: #007bff;
             text-decoration: none;
-        }}
-        .links a:hover {{
+        }
+        .links a:hover {
             text-decoration: underline;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -273,135 +156,354 @@ class VisualizationService:
         
         <div class="data-section">
             <h2>Stock Analysis Details</h2>
-            {stock_boxes_html}
+            """
+
+_HTML_MIDDLE = """
         </div>
     </div>
 
     <script>
         const ctx = document.getElementById('sentimentChart').getContext('2d');
-        const chart = new Chart(ctx, {{
+        const chart = new Chart(ctx, {
             type: 'scatter',
-            data: {{
-                datasets: {json.dumps([dataset.model_dump() for dataset in datasets])}
-            }},
-            options: {{
+            data: {
+                datasets: """
+
+_HTML_SUFFIX = """
+            },
+            options: {
                 responsive: true,
                 maintainAspectRatio: false,
-                plugins: {{
-                    title: {{
+                plugins: {
+                    title: {
                         display: true,
                         text: 'Stock Sentiment vs Presence Analysis',
-                        font: {{
+                        font: {
                             size: 16
-                        }}
-                    }},
-                    legend: {{
+                        }
+                    },
+                    legend: {
                         display: true,
                         position: 'right'
-                    }},
-                    tooltip: {{
-                        callbacks: {{
-                            label: function(context) {{
+                    },
+                    tooltip: {
+                        callbacks: {
+                            label: function(context) {
                                 const label = context.dataset.label || '';
                                 const x = context.parsed.x.toFixed(2);
                                 const y = context.parsed.y.toFixed(2);
-                                return `${{label}}: Sentiment ${{x}}, Presence ${{y}}`;
-                            }}
-                        }}
-                    }}
-                }},
-                scales: {{
-                    x: {{
+                                return `${label}: Sentiment ${x}, Presence ${y}`;
+                            }
+                        }
+                    }
+                },
+                scales: {
+                    x: {
                         type: 'linear',
                         position: 'bottom',
-                        title: {{
+                        title: {
                             display: true,
                             text: 'Sentiment (-1.0 to 1.0)'
-                        }},
+                        },
                         min: -1.1,
                         max: 1.1,
-                        grid: {{
-                            color: function(context) {{
-                                if (context.tick.value === 0) {{
+                        grid: {
+                            color: function(context) {
+                                if (context.tick.value === 0) {
                                     return '#666';
-                                }}
+                                }
                                 return '#e0e0e0';
-                            }},
-                            lineWidth: function(context) {{
-                                if (context.tick.value === 0) {{
+                            },
+                            lineWidth: function(context) {
+                                if (context.tick.value === 0) {
                                     return 2;
-                                }}
+                                }
                                 return 1;
-                            }}
-                        }}
-                    }},
-                    y: {{
-                        title: {{
+                            }
+                        }
+                    },
+                    y: {
+                        title: {
                             display: true,
                             text: 'Presence (0.0 to 1.0)'
-                        }},
+                        },
                         min: 0,
                         max: 1.1,
-                        grid: {{
+                        grid: {
                             color: '#e0e0e0'
-                        }}
-                    }}
-                }},
-                interaction: {{
+                        }
+                    }
+                },
+                interaction: {
                     intersect: false,
                     mode: 'point'
-                }}
-            }}
-        }});
+                }
+            }
+        });
     </script>
 </body>
 </html>"""
 
-    async def create_plot(self, *, data: list[PlotDataPoint]) -> None:
-        """Create an interactive sentiment plot and open it in the browser.
+
+# The static parts are plain ASCII, so they are encoded once up front
+_HTML_PREFIX_B, _HTML_MIDDLE_B, _HTML_SUFFIX_B = (
+    part.encode("ascii") for part in (_HTML_PREFIX, _HTML_MIDDLE, _HTML_SUFFIX)
+)
+
+# Dataset colors, cycled through by stock index
+_COLORS = tuple(
+    sys.intern(color)
+    for color in (
+        "#FF6384",
+        "#36A2EB",
+        "#FFCE56",
+        "#4BC0C0",
+        "#9966FF",
+        "#FF9F40",
+        "#FF6384",
+        "#C9CBCF",
+        "#4BC0C0",
+        "#FF6384",
+    )
+)
+_NCOLORS = len(_COLORS)
+
+
+@dataclass(slots=True)
+class _CachedPage:
+    """A rendered HTML page kept in the render cache."""
+
+    # Encoded chunks of the page, in order
+    chunks: tuple[bytes, ...]
+    size: int
+    # In-memory file holding the page, created the first time it is written out
+    memfd: int | None = None
+
+
+# Rendered pages keyed by a digest of their input data, least recently used first
+_HTML_CACHE: OrderedDict[bytes, _CachedPage] = OrderedDict()
+_HTML_CACHE_SIZE = 32
+
+
+def _sendfile_all(out_fd: int, in_fd: int, size: int) -> None:
+    """Copy the first size bytes of a file to another with os.sendfile.
+
+    Args:
+        out_fd: Descriptor to copy to, written from its current position.
+        in_fd: Descriptor to copy from, read from offset 0.
+        size: Number of bytes to copy.
+
+    Raises:
+        OSError: If the copy fails or the source ends before size bytes.
+    """
+    offset = 0
+    while offset < size:
+        sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+        if sent == 0:
+            raise OSError(f"sendfile stopped after {offset} of {size} bytes")
+        offset += sent
+
+
+def _write_page(fd: int, page: _CachedPage) -> None:
+    """Write a rendered page to a file.
+
+    Repeat writes of the same page are copied by the kernel from an in-memory
+    file with os.sendfile. Where os.memfd_create is unavailable (e.g. macOS), or
+    the copy fails, the chunks are written through a buffered writer.
+
+    Args:
+        fd: Descriptor of the file to write to, opened for reading and writing.
+        page: The page to write.
+    """
+    if page.memfd is not None:
+        try:
+            _sendfile_all(fd, page.memfd, page.size)
+            return
+        except OSError as e:
+            logger.warning(f"Error copying cached page, rewriting it: {str(e)}")
+            os.close(page.memfd)
+            page.memfd = None
+            # Discard whatever part of the page was copied
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.ftruncate(fd, 0)
+
+    with open(fd, "wb", buffering=65536, closefd=False) as html_file:
+        html_file.writelines(page.chunks)
+
+    if hasattr(os, "memfd_create"):
+        # Keep a kernel-side copy of the page for the next write
+        memfd = None
+        try:
+            memfd = os.memfd_create("r_stocks_plot")
+            _sendfile_all(memfd, fd, page.size)
+        except OSError as e:
+            logger.warning(f"Error caching page in memory: {str(e)}")
+            if memfd is not None:
+                os.close(memfd)
+        else:
+            page.memfd = memfd
+
+
+def _open_in_browser(url: str) -> None:
+    """Open the URL in a new browser window, logging any failure.
+
+    Args:
+        url: The URL to open.
+    """
+    try:
+        webbrowser.open_new(url)
+    except Exception as e:
+        logger.error(f"Error opening browser: {str(e)}")
+
+
+def _cache_key(data: list[PlotDataPoint]) -> bytes:
+    """Compute the HTML cache key for the given plot data.
+
+    Args:
+        data: List of stock data to plot.
+
+    Returns:
+        Digest of the canonical JSON representation of the data.
+    """
+    canonical = json.dumps([item.model_dump() for item in data], sort_keys=True)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).digest()
+
+
+@dataclass
+class VisualizationService:
+    """Service for creating interactive stock sentiment visualizations."""
+
+    @classmethod
+    async def create(cls) -> "VisualizationService":
+        """Create a new VisualizationService instance."""
+        return cls()
+
+    async def _generate_datasets(self, *, data: list[PlotDataPoint]) -> list[dict]:
+        """Generate Chart.js datasets from stock data.
 
         Args:
-            data: List of stock data dictionaries containing Symbol, Sentiment, Presence, etc.
+            data: List of stock data dictionaries.
+
+        Returns:
+            List of Chart.js dataset dictionaries.
         """
-        try:
-            # Generate full HTML for the plot
-            html = await self.create_plot_html(data=data)
+        return [
+            {
+                "label": item.symbol,
+                "data": [{"x": item.sentiment, "y": item.presence}],
+                "backgroundColor": (color := _COLORS[i % _NCOLORS]),
+                "borderColor": color,
+                # Point size based on presence (radius between 5-20)
+                "pointRadius": (radius := max(5.0, min(20.0, item.presence * 20))),
+                "pointHoverRadius": radius + 3,
+            }
+            for i, item in enumerate(data)
+        ]
 
-            # Write to temporary file
-            with tempfile.NamedTemporaryFile(
-                delete=False, suffix=".html", dir="/tmp"
-            ) as tmp:
-                tmp.write(html.encode("utf-8"))
-                html_path = tmp.name
+    async def _generate_stock_boxes(
+        self, *, stock_data: list[PlotDataPoint]
+    ) -> list[bytes]:
+        """Generate the encoded HTML for stock information boxes.
 
-            # Open in browser
-            url = f"file://{os.path.abspath(html_path)}"
-            webbrowser.open_new(url)
+        Args:
+            stock_data: List of stock data dictionaries.
 
-            logger.info(f"Created visualization at {html_path}")
+        Returns:
+            UTF-8 encoded HTML for each stock box.
+        """
+        return render_boxes(stock_data)
 
-        except Exception as e:
-            logger.error(f"Error creating plot: {str(e)}")
-            raise
+    async def _get_html_chunks(
+        self, *, datasets: list[dict], stock_boxes: list[bytes]
+    ) -> tuple[bytes, ...]:
+        """Generate the complete UTF-8 encoded HTML page for the visualization.
 
-    async def create_plot_html(self, *, data: list[PlotDataPoint]) -> str:
-        """Create HTML for the sentiment plot without opening it in the browser.
+        Args:
+            datasets: Chart.js datasets.
+            stock_boxes: Encoded HTML for each stock box.
+
+        Returns:
+            The chunks of the HTML page, in order.
+        """
+        # Escape every "<" so no label can open or close tags in the <script>
+        datasets_json = orjson.dumps(datasets).replace(b"<", b"\\u003c")
+        return (
+            _HTML_PREFIX_B,
+            *stock_boxes,
+            _HTML_MIDDLE_B,
+            datasets_json,
+            _HTML_SUFFIX_B,
+        )
+
+    async def _render_page(self, *, data: list[PlotDataPoint]) -> _CachedPage:
+        """Render the encoded HTML page for the plot, reusing earlier renders.
 
         Args:
             data: List of stock data dictionaries containing Symbol, Sentiment, Presence, etc.
 
         Returns:
-            HTML string for the sentiment plot.
+            The rendered page.
         """
+        # Identical data renders identical HTML, so reuse earlier renders
+        key = _cache_key(data)
+        page = _HTML_CACHE.get(key)
+        if page is not None:
+            _HTML_CACHE.move_to_end(key)
+            return page
+
         # Generate Chart.js datasets
-        datasets: list[PlotDatasetPoint] = await self._generate_datasets(data=data)
+        datasets: list[dict] = await self._generate_datasets(data=data)
 
         # Generate stock information boxes
-        stock_boxes_html = await self._generate_stock_boxes_html(stock_data=data)
+        stock_boxes = await self._generate_stock_boxes(stock_data=data)
 
         # Generate complete HTML
-        html = await self._get_html_template(
-            datasets=datasets, stock_boxes_html=stock_boxes_html
-        )
+        chunks = await self._get_html_chunks(datasets=datasets, stock_boxes=stock_boxes)
+        page = _CachedPage(chunks=chunks, size=sum(map(len, chunks)))
 
-        return html
+        _HTML_CACHE[key] = page
+        if len(_HTML_CACHE) > _HTML_CACHE_SIZE:
+            _, evicted = _HTML_CACHE.popitem(last=False)
+            if evicted.memfd is not None:
+                os.close(evicted.memfd)
+
+        return page
+
+    async def build_html(self, *, data: list[PlotDataPoint]) -> str:
+        """Build the HTML for the sentiment plot without writing or opening it.
+
+        Args:
+            data: List of stock data dictionaries containing Symbol, Sentiment, Presence, etc.
+
+        Returns:
+            HTML string for the sentiment plot.
+        """
+        page = await self._render_page(data=data)
+        return b"".join(page.chunks).decode("utf-8")
+
+    async def create_plot(self, *, data: list[PlotDataPoint]) -> None:
+        """Create an interactive sentiment plot and open it in the browser.
+
+        Args:
+            data: List of stock data dictionaries containing Symbol, Sentiment, Presence, etc.
+        """
+        try:
+            # Generate full HTML for the plot
+            page = await self._render_page(data=data)
+
+            # Write to temporary file
+            fd, html_path = tempfile.mkstemp(suffix=".html", dir="/tmp")
+            try:
+                _write_page(fd, page)
+            finally:
+                os.close(fd)
+
+            # Open in browser
+            url = Path(html_path).as_uri()
+            threading.Thread(target=_open_in_browser, args=(url,), daemon=True).start()
+
+            logger.info(f"Created visualization at {html_path}")
+
+        except Exception as e:
+            logger.error(f"Error creating plot: {str(e)}")
+            raise
@@ -29,7 +29,8 @@ def pytest_configure(config: pytest.Config) -> None:
 
 @pytest.fixture
 def reddit_client_mock(mocker: MockerFixture) -> MagicMock:
-    """Mock the asyncpraw Reddit client."""
+    """Mock the asyncpraw Reddit client and its HTTP session."""
+    mocker.patch("services.reddit_service._new_session")
     return mocker.patch("services.reddit_service.asyncpraw")
 
 
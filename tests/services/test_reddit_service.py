@@ -1,9 +1,11 @@
 """Test cases for RedditService to ensure it correctly fetches posts from a subreddit."""
 
+from itertools import islice
+
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from services.reddit_service import RedditService
+from services.reddit_service import CommentRow, RedditService, _iter_comments
 
 
 @pytest.mark.asyncio
@@ -83,3 +85,133 @@ async def test_fetch_subreddit_posts_api_error(
     # Verify error response
     assert "error" in result
     assert "Failed to fetch posts: API Error" in result["error"]
+
+
+@pytest.mark.asyncio
+async def test_create_closes_session_on_client_error(
+    reddit_client_mock: MagicMock,
+) -> None:
+    """Test that the HTTP session is closed if the Reddit client cannot be built."""
+    reddit_client_mock.Reddit.side_effect = Exception("Bad config")
+
+    with patch("services.reddit_service._new_session") as new_session_mock:
+        new_session_mock.return_value.close = AsyncMock()
+        service = await RedditService.create()
+
+    assert service.client is None
+    new_session_mock.return_value.close.assert_awaited_once()
+
+
+def test_iter_comments_depth_first() -> None:
+    """Test that the comment forest is walked depth-first and lazily."""
+
+    def _comment(comment_id: str, replies: list | None = None) -> MagicMock:
+        comment = MagicMock()
+        comment.id = comment_id
+        comment.replies = replies or []
+        return comment
+
+    forest = [
+        _comment("a", [_comment("a1", [_comment("a1x")]), _comment("a2")]),
+        _comment("b"),
+    ]
+
+    assert [c.id for c in _iter_comments(forest)] == ["a", "a1", "a1x", "a2", "b"]
+    assert [c.id for c in islice(_iter_comments(forest), 2)] == ["a", "a1"]
+
+
+def _mock_submission(comments: list[MagicMock]) -> MagicMock:
+    """Create a mock submission whose comment forest holds the given comments."""
+    submission = MagicMock()
+    submission.load = AsyncMock()
+    submission.comments.replace_more = AsyncMock()
+    submission.comments.__iter__.side_effect = lambda: iter(comments)
+    return submission
+
+
+@pytest.mark.asyncio
+async def test_fetch_single_post_extracts_id_from_url(
+    reddit_client_mock: MagicMock,
+) -> None:
+    """Test that post IDs are taken from Reddit URLs with and without a slug."""
+    mock_reddit = AsyncMock()
+    mock_reddit.submission.return_value = _mock_submission([])
+    reddit_client_mock.Reddit.return_value = mock_reddit
+    service = await RedditService.create()
+
+    for post_id in [
+        "abc123",
+        "https://www.reddit.com/r/stocks/comments/abc123",
+        "https://www.reddit.com/r/stocks/comments/abc123/",
+        "https://www.reddit.com/r/stocks/comments/abc123/some_post_title/",
+    ]:
+        result = await service.fetch_single_post(post_id=post_id)
+
+        assert "post" in result
+        mock_reddit.submission.assert_awaited_with(id="abc123")
+
+
+@pytest.mark.asyncio
+async def test_fetch_single_post_invalid_url(reddit_client_mock: MagicMock) -> None:
+    """Test that a URL without a comments path is rejected."""
+    mock_reddit = AsyncMock()
+    reddit_client_mock.Reddit.return_value = mock_reddit
+    service = await RedditService.create()
+
+    result = await service.fetch_single_post(post_id="https://www.reddit.com/r/stocks/")
+
+    assert result == {"error": "Invalid Reddit URL format"}
+    mock_reddit.submission.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_fetch_single_post_comment_rows(reddit_client_mock: MagicMock) -> None:
+    """Test that comments become CommentRows, with deleted authors as 'Unknown'."""
+    author = MagicMock()
+    author.name = "alice"
+    comments = [
+        MagicMock(
+            id="c1",
+            author=author,
+            body="Buying more.",
+            score=5,
+            created_utc=1.0,
+            parent_id="t3_abc123",
+            replies=[],
+        ),
+        MagicMock(
+            id="c2",
+            author=None,
+            body="[deleted]",
+            score=0,
+            created_utc=2.0,
+            parent_id="t1_c1",
+            replies=[],
+        ),
+    ]
+    mock_reddit = AsyncMock()
+    mock_reddit.submission.return_value = _mock_submission(comments)
+    reddit_client_mock.Reddit.return_value = mock_reddit
+    service = await RedditService.create()
+
+    result = await service.fetch_single_post(post_id="abc123")
+
+    rows = result["post"]["comments"]
+    assert rows == [
+        CommentRow(
+            id="c1",
+            author="alice",
+            body="Buying more.",
+            score=5,
+            created_utc=1.0,
+            parent_id="t3_abc123",
+        ),
+        CommentRow(
+            id="c2",
+            author="Unknown",
+            body="[deleted]",
+            score=0,
+            created_utc=2.0,
+            parent_id="t1_c1",
+        ),
+    ]
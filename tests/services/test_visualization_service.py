@@ -1,18 +1,21 @@
 """Test cases for the VisualizationService."""
 
+from pathlib import Path
+
 import pytest
+from pytest_mock import MockerFixture
 
 from models import PlotDataPoint
 from services.visualization_service import VisualizationService
 
 
 @pytest.mark.asyncio
-async def test_create_plot_html(sample_plot_data: list[PlotDataPoint]) -> None:
-    """Test creating plot HTML with sample data."""
+async def test_build_html(sample_plot_data: list[PlotDataPoint]) -> None:
+    """Test building plot HTML with sample data."""
     # Create VisualizationService instance
     service = await VisualizationService.create()
 
-    html = await service.create_plot_html(data=sample_plot_data)
+    html = await service.build_html(data=sample_plot_data)
 
     # Verify that the HTML contains expected elements
     assert "<head>" in html
@@ -22,3 +25,99 @@ async def test_create_plot_html(sample_plot_data: list[PlotDataPoint]) -> None:
     assert sample_plot_data[0].links[0].title in html
     assert str(sample_plot_data[0].links[0].url) in html
     assert sample_plot_data[0].summary in html
+
+
+@pytest.mark.asyncio
+async def test_render_page_reuses_cached_render(
+    sample_plot_data: list[PlotDataPoint],
+) -> None:
+    """Test that rendering the same data twice returns the cached HTML."""
+    service = await VisualizationService.create()
+
+    first = await service._render_page(data=sample_plot_data)
+    second = await service._render_page(data=sample_plot_data)
+    other = await service._render_page(data=sample_plot_data[:1])
+
+    assert second is first
+    assert other != first
+
+
+@pytest.mark.asyncio
+async def test_build_html_escapes_text() -> None:
+    """Test that LLM-provided text is HTML-escaped in the stock boxes."""
+    service = await VisualizationService.create()
+    data = [
+        PlotDataPoint(
+            symbol="AT&T Inc. (T)",
+            sentiment=0.1,
+            presence=0.5,
+            summary="<b>Bold</b> claims",
+            links=[{"url": 'https://example.com/?a=1&b="2"', "title": "<i>Post</i>"}],
+        ),
+        PlotDataPoint(
+            symbol="</script><script>alert(1)</script> (AAPL)",
+            sentiment=0.2,
+            presence=0.4,
+            summary="Script injection attempt",
+        ),
+        PlotDataPoint(
+            symbol="<!--<script> (AAPL)",
+            sentiment=0.3,
+            presence=0.3,
+            summary="Comment injection attempt",
+        ),
+    ]
+
+    html = await service.build_html(data=data)
+
+    assert "AT&amp;T Inc. (T)" in html
+    assert "&lt;b&gt;Bold&lt;/b&gt; claims" in html
+    assert 'href="https://example.com/?a=1&amp;b=&quot;2&quot;"' in html
+    assert "&lt;i&gt;Post&lt;/i&gt;" in html
+    assert "</script><script>" not in html
+    assert "<!--" not in html
+    assert "\\u003c/script>\\u003cscript>alert(1)\\u003c/script> (AAPL)" in html
+    assert "\\u003c!--\\u003cscript> (AAPL)" in html
+
+
+@pytest.mark.asyncio
+async def test_create_plot_writes_repeat_renders(
+    mocker: MockerFixture, sample_plot_data: list[PlotDataPoint]
+) -> None:
+    """Test that writing the same plot twice produces identical files."""
+    thread_mock = mocker.patch("services.visualization_service.threading.Thread")
+    service = await VisualizationService.create()
+
+    await service.create_plot(data=sample_plot_data)
+    await service.create_plot(data=sample_plot_data)
+
+    html = await service.build_html(data=sample_plot_data)
+    for call in thread_mock.call_args_list:
+        html_path = Path(call.kwargs["args"][0].removeprefix("file://"))
+        try:
+            assert html_path.read_text(encoding="utf-8") == html
+        finally:
+            html_path.unlink()
+    assert thread_mock.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_create_plot_falls_back_when_copy_fails(
+    mocker: MockerFixture, sample_plot_data: list[PlotDataPoint]
+) -> None:
+    """Test that a repeat render is rewritten in full if the kernel copy stalls."""
+    thread_mock = mocker.patch("services.visualization_service.threading.Thread")
+    service = await VisualizationService.create()
+
+    await service.create_plot(data=sample_plot_data)
+    mocker.patch("services.visualization_service.os.sendfile", return_value=0)
+    await service.create_plot(data=sample_plot_data)
+
+    html = await service.build_html(data=sample_plot_data)
+    for call in thread_mock.call_args_list:
+        html_path = Path(call.kwargs["args"][0].removeprefix("file://"))
+        try:
+            assert html_path.read_text(encoding="utf-8") == html
+        finally:
+            html_path.unlink()
+    assert thread_mock.call_count == 2
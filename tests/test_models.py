@@ -0,0 +1,42 @@
+"""Test cases for the pydantic models."""
+
+from models import Link, PlotDataPoint
+
+
+def test_from_trusted_matches_validated(
+    sample_plot_data: list[PlotDataPoint],
+) -> None:
+    """Test that from_trusted builds the same data as a validated instance."""
+    validated = sample_plot_data[0]
+
+    trusted = PlotDataPoint.from_trusted(validated.model_dump())
+
+    assert trusted.symbol == validated.symbol
+    assert trusted.sentiment == validated.sentiment
+    assert trusted.presence == validated.presence
+    assert trusted.summary == validated.summary
+    assert isinstance(trusted.links[0], Link)
+    assert trusted.links[0].url == validated.links[0].url
+    assert trusted.links[0].title == validated.links[0].title
+
+
+def test_plot_data_point_accepts_integer_scores() -> None:
+    """Test that integer sentiment/presence values are coerced to floats."""
+    point = PlotDataPoint(
+        symbol="Apple Inc. (AAPL)",
+        sentiment=0,
+        presence=1,
+        summary="Neutral sentiment.",
+    )
+
+    assert point.sentiment == 0.0
+    assert isinstance(point.sentiment, float)
+    assert point.presence == 1.0
+    assert isinstance(point.presence, float)
+
+
+def test_plot_data_point_ticker(sample_plot_data: list[PlotDataPoint]) -> None:
+    """Test that the ticker is extracted from the symbol."""
+    assert sample_plot_data[0].symbol == "Intel Corporation (INTC)"
+    assert sample_plot_data[0].ticker == "INTC"
+    assert sample_plot_data[0].model_dump()["ticker"] == "INTC"